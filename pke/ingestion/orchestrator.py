@@ -22,6 +22,7 @@ The orchestrator does *not* perform:
 
 import logging
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional, Sequence
 from pke.ingestion.tag_resolution import extract_all_tags, map_note_tags_to_ids
@@ -53,6 +54,56 @@ def _get_logger() -> logging.Logger:
     return logger
 
 
+# ----------------------------------------------------------------------------
+# EMBEDDINGS — ONE PROVIDER CALL PER UNIQUE BODY
+# ----------------------------------------------------------------------------
+def _generate_embedding(
+    embedding_client: Any,
+    body: str,
+    cache: Dict[str, List[float]],
+    remaining: Counter[str],
+) -> List[float]:
+    """
+    Return the embedding for `body`, generating it at most once per run.
+
+    Bulk imports often contain many notes with identical bodies (templates,
+    "TODO", copied boilerplate), so duplicates within one ingest_notes()
+    call share a single vector. `remaining` holds how many notes still need
+    each body (see _count_bodies()); only bodies with later duplicates are
+    kept in `cache`, and each entry is dropped once its last duplicate has
+    been embedded, so unique notes are never held for the whole run.
+
+    Non-string bodies are passed straight to the provider uncached, so a
+    malformed note fails on its own inside the per-note error handling.
+    """
+    if not isinstance(body, str):
+        return embedding_client.generate(body)
+
+    remaining[body] -= 1
+    if remaining[body] <= 0:
+        # Last (or only) use of this body — hand it out without keeping it.
+        del remaining[body]
+        embedding = cache.pop(body, None)
+        return embedding if embedding is not None else embedding_client.generate(body)
+
+    embedding = cache.get(body)
+    if embedding is None:
+        embedding = embedding_client.generate(body)
+        cache[body] = embedding
+    return embedding
+
+
+def _count_bodies(parsed_notes: Sequence[Mapping[str, Any]]) -> Counter[str]:
+    """
+    Count how many notes share each non-empty string body.
+
+    Runs before the per-note error handling, so anything else (e.g. a
+    malformed list body) is skipped here rather than aborting the run.
+    """
+    bodies = (note.get("body") for note in parsed_notes)
+    return Counter(body for body in bodies if isinstance(body, str) and body)
+
+
 # ============================================================================
 # INGESTION REPORT — STRUCTURED PIPELINE METRICS
 # ============================================================================
@@ -140,6 +191,11 @@ def ingest_notes(
 
     report = IngestionReport()
 
+    # Embeddings for bodies that repeat later in the batch, plus how many
+    # notes still need each body — see _generate_embedding().
+    embedding_cache: Dict[str, List[float]] = {}
+    body_uses = _count_bodies(parsed_notes)
+
     logger = _get_logger()
     total = len(parsed_notes) if hasattr(parsed_notes, "__len__") else "?"
 
@@ -186,7 +242,9 @@ def ingest_notes(
             notebook_id = note.get("notebook")
 
             # Deterministic embedding generation (tests assert on this).
-            embedding = embedding_client.generate(note["body"])
+            embedding = _generate_embedding(
+                embedding_client, note["body"], embedding_cache, body_uses
+            )
 
             # Construct a NoteRecord‑like structure.
             # Tests assert on the *shape* of this record, not its persistence.
@@ -329,7 +387,9 @@ def ingest_notes(
             # --------------------------------------------------------
             # Embedding generation (delegated to client's embedding_client)
             # --------------------------------------------------------
-            embedding = client.embedding_client.generate(note["body"])
+            embedding = _generate_embedding(
+                client.embedding_client, note["body"], embedding_cache, body_uses
+            )
 
             # --------------------------------------------------------
             # Note upsert (Option B1 contract: "inserted" or "updated")
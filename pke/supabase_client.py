@@ -27,8 +27,12 @@ Design goals:
         - MockSupabaseClient and real SupabaseClient share the same contract
 """
 
+import random
+import time
 from typing import Any, Dict, List, Optional, TypeVar, cast
 
+import httpx
+
 from pke.embedding.embedding_client import EmbeddingClient
 from pke.types import NoteRecord
 
@@ -83,6 +87,46 @@ def _extract_data(resp: Any) -> List[T]:
     return cast(List[T], [data])
 
 
+# ---------------------------------------------------------------------------
+# Helper: classify transient Supabase failures
+# ---------------------------------------------------------------------------
+def _is_transient(status: Any) -> bool:
+    """
+    Return True if an HTTP status (int or numeric string) is worth retrying.
+
+    429 (rate limited) and any 5xx are treated as transient; everything
+    else — including validation errors and missing statuses — is not.
+    """
+    try:
+        code = int(status)
+    except (TypeError, ValueError):
+        return False
+    return code == 429 or 500 <= code < 600
+
+
+def _transient_status(obj: Any) -> Any:
+    """
+    Pull an HTTP status out of a response or exception, whichever shape
+    the client uses (dict "status", .status_code, .status, the attached
+    httpx .response, or an integer .code).
+
+    postgrest's APIError only carries the HTTP status in `.code` when the
+    error body was not JSON; for JSON bodies `.code` is a PGRST/SQLSTATE
+    string, so string codes are ignored rather than parsed as a status.
+    """
+    if isinstance(obj, dict):
+        return obj.get("status")
+    for attr in ("status_code", "status"):
+        value = getattr(obj, attr, None)
+        if value is not None:
+            return value
+    response = getattr(obj, "response", None)
+    if response is not None:
+        return getattr(response, "status_code", None)
+    code = getattr(obj, "code", None)
+    return code if isinstance(code, int) else None
+
+
 # ---------------------------------------------------------------------------
 # Main wrapper class
 # ---------------------------------------------------------------------------
@@ -190,6 +234,46 @@ class SupabaseClient:
             raise RuntimeError("Supabase client is not configured")
         return self.client
 
+    def _execute_with_retry(
+        self,
+        table: str,
+        payload: Any,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ) -> Any:
+        """
+        Run `client.table(table).upsert(payload).execute()` with retries.
+
+        Transient failures — an HTTP 429 or 5xx status, or an
+        httpx.TransportError (connect errors, timeouts, dropped
+        connections) from the supabase-py client — are retried up to
+        `retries` more times with exponential backoff and a little jitter:
+        backoff * 2**attempt + random() * 0.1 seconds.
+
+        Anything else — and the final transient failure — is returned or
+        raised unchanged so _extract_data / the caller sees it as before.
+        """
+        client = self._require_client()
+
+        for attempt in range(retries + 1):
+            last_attempt = attempt == retries
+            try:
+                resp = client.table(table).upsert(payload).execute()
+            except Exception as e:
+                transient = isinstance(
+                    e, (httpx.TransportError, ConnectionError, TimeoutError)
+                ) or _is_transient(_transient_status(e))
+                if last_attempt or not transient:
+                    raise
+            else:
+                if last_attempt or not _is_transient(_transient_status(resp)):
+                    return resp
+
+            time.sleep(backoff * 2**attempt + random.random() * 0.1)
+
+        # Unreachable: the final attempt always returns or raises.
+        raise RuntimeError("Supabase upsert retry loop exited unexpectedly")
+
     # ------------------------------------------------------------
     # File break point 2
     # ------------------------------------------------------------
@@ -321,7 +405,10 @@ class SupabaseClient:
         # Supabase will:
         #   • insert a new row if id does not exist
         #   • update the existing row if id already exists
-        resp = client.table(table).upsert(payload).execute()
+        #
+        # Only the network call is retried — the embedding and payload above
+        # are built once and reused across attempts.
+        resp = self._execute_with_retry(table, payload)
         _extract_data(resp)  # surface any errors
 
         # Step 4: return a simple status string for the orchestrator.
@@ -120,14 +120,25 @@ class TableQuery(TypedDict):
 # ---------------------------------------------------------------------------
 # Executable
 # ---------------------------------------------------------------------------
-# A generic callable interface.
+# The terminal step of a Supabase query chain:
+#   client.table(name).upsert(record)  →  Executable
+#   Executable.execute()               →  SupabaseExecuteResponse
 #
-# Used for typing injected functions, callbacks, or command handlers.
-# This is intentionally broad — any callable is acceptable.
+# Implementations (e.g. DummyExecutable) conform structurally and must not
+# subclass this Protocol — mypy checks conformance statically, and skipping
+# the Protocol base keeps _ProtocolMeta out of their construction path.
+# It is deliberately *not* @runtime_checkable; use hasattr(x, "execute")
+# if a runtime check is ever needed.
 # ---------------------------------------------------------------------------
 class Executable(Protocol):
+    # Empty slots keep slotted implementations (e.g. test doubles) free of
+    # an inherited per-instance __dict__.
+    __slots__ = ()
+
     def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
 
+    def execute(self) -> SupabaseExecuteResponse: ...
+
 
 # ---------------------------------------------------------------------------
 # SupabaseClientInterface
@@ -156,6 +167,9 @@ class Executable(Protocol):
 #   FailingClient.
 # ---------------------------------------------------------------------------
 class SupabaseClientInterface(Protocol):
+    # See Executable: lets implementations opt into __slots__.
+    __slots__ = ()
+
     def table(self, name: str) -> Any:
         """
         Return a query builder for the given table.
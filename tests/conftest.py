@@ -12,7 +12,7 @@ stable test behavior across environments and future refactors.
 """
 
 import json
-from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 from typer.testing import CliRunner
@@ -20,8 +20,8 @@ from typer.testing import CliRunner
 # ============================================================================
 # FIXTURE DIRECTORY
 # ============================================================================
-FIXTURES_DIR = Path(__file__).parent / "fixtures"
-
+# Defined once in tests/paths.py and shared with tests/unit/conftest.py.
+from tests.paths import FIXTURES_DIR
 
 # ============================================================================
 # 1.1 — SHARED TEST INFRASTRUCTURE
@@ -244,6 +244,113 @@ def mock_supabase_client(mock_embedding_client):
     return MockSupabaseClient()
 
 
+# ---------------------------------------------------------------------------
+# Fixtures: parsed_notes_dry_run / parsed_notes_mocked
+# ---------------------------------------------------------------------------
+# Simulated Stage 1 output for the E2E ingestion tests. Built once per
+# session and frozen (tuple of read-only mappings, tuple tags) so no test
+# can leak a mutation into another.
+def _freeze_notes(notes):
+    frozen = []
+    for note in notes:
+        note = dict(note, tags=tuple(note.get("tags", ())))
+        if "metadata" in note:
+            note["metadata"] = MappingProxyType(note["metadata"])
+        frozen.append(MappingProxyType(note))
+    return tuple(frozen)
+
+
+@pytest.fixture(scope="session")
+def parsed_notes_dry_run():
+    """Three notes (one with an empty body) for the dry-run E2E test."""
+    return _freeze_notes(
+        [
+            {
+                "id": "note-1",
+                "title": "Test Note One",
+                "body": "This is a test note.",
+                "notebook": "Work",
+                "tags": ["project", "urgent"],
+                "metadata": {"created_time": "2024-01-01T12:00:00"},
+            },
+            {
+                "id": "note-2",
+                "title": "Test Note Two",
+                "body": "Another test note.",
+                "notebook": "Personal",
+                "tags": ["journal"],
+                "metadata": {"created_time": "2024-01-02T12:00:00"},
+            },
+            {
+                "id": "note-3",
+                "title": "Empty Body Note",
+                "body": "",
+                "notebook": "Work",
+                "tags": ["skipme"],
+                "metadata": {"created_time": "2024-01-03T12:00:00"},
+            },
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def parsed_notes_mocked():
+    """
+    Two notes in two notebooks for the mocked-Supabase E2E test.
+
+    The orchestrator requires the field "body", not "content"; a missing
+    body raises KeyError('body'), which is recorded as a failure.
+    """
+    return _freeze_notes(
+        [
+            {
+                "id": "n1",
+                "title": "Note A",
+                "body": "Alpha content",
+                "notebook": "Work",
+                "tags": ["t1", "t2"],
+            },
+            {
+                "id": "n2",
+                "title": "Note B",
+                "body": "Bravo content",
+                "notebook": "Personal",
+                "tags": ["t2"],
+            },
+        ]
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fixture: dummy_client
+# ---------------------------------------------------------------------------
+# Tables SupabaseClient touches; created up front on the shared client.
+_DUMMY_TABLES = ("notes", "notebooks", "tags", "note_tags", "chunks")
+
+
+@pytest.fixture(scope="session")
+def _shared_dummy_client():
+    """One DummyClient for the whole session, with its tables pre-built."""
+    from tests.dummy_supabase import DummyClient
+
+    client = DummyClient()
+    for name in _DUMMY_TABLES:
+        client.table(name)
+    return client
+
+
+@pytest.fixture
+def dummy_client(_shared_dummy_client):
+    """
+    Session-shared DummyClient, reset before each test.
+
+    reset() only clears per-test state (last_upserted), so tests get an
+    isolated view without re-allocating the client and its tables.
+    """
+    _shared_dummy_client.reset()
+    return _shared_dummy_client
+
+
 # ---------------------------------------------------------------------------
 # Fixture: temp_work_dir
 # ---------------------------------------------------------------------------
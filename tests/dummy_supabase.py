@@ -15,7 +15,8 @@ Both clients also implement the `.list()` method used by SupabaseClient,
 ensuring end‑to‑end test coverage for read and write operations.
 """
 
-from typing import Any, Dict, List, Optional, Union, cast
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from pke.types import (
     NoteRecord,
@@ -23,7 +24,41 @@ from pke.types import (
     SupabaseExecuteResponse,
     TableQuery,
 )
-from pke.types import Executable
+
+# =====================================================================
+# Shared read‑only payloads
+# =====================================================================
+# Built once at import; DummyClient.list() hands back the same objects on
+# every call instead of allocating a fresh 1536‑float list each time.
+# Tests only read these — copy locally before mutating.
+
+# A read‑only float32 view over 6 KB of zero bytes: one flat buffer rather
+# than a 1536‑slot tuple, and np.asarray(_DUMMY_EMBEDDING) is zero‑copy for
+# any test that wants an ndarray. It supports len(), indexing and iteration.
+_DUMMY_EMBEDDING = memoryview(bytes(1536 * 4)).cast("f")
+
+# The note itself is a read‑only mapping: any test that tries to write to
+# it fails loudly instead of leaking changes into later tests. Take a
+# dict(_CANONICAL_NOTE) copy at the call site if a mutable record is needed.
+_CANONICAL_NOTE: NoteRecord = cast(
+    NoteRecord,
+    MappingProxyType(
+        {
+            "id": "dummy-id",
+            "title": "dummy title",
+            "body": "dummy body",
+            "metadata": MappingProxyType({}),
+            "embedding": _DUMMY_EMBEDDING,
+        }
+    ),
+)
+
+_DUMMY_LIST_RESPONSE: List[NoteRecord] = [_CANONICAL_NOTE]
+
+# Every failing execute() returns this same dict. It stays a plain dict
+# (not a MappingProxyType) because _extract_data only inspects "status"
+# on dict responses — a proxy would be read as an empty SDK response.
+_FAIL_RESP: SupabaseExecuteResponse = {"status": 500, "data": None}
 
 # =====================================================================
 # DummyExecuteResponse — simple stand‑in for SupabaseExecuteResponse
@@ -39,6 +74,8 @@ class DummyExecuteResponse:
         • error — optional error message
     """
 
+    __slots__ = ("data", "error")
+
     def __init__(self, data: Any = None, error: Optional[str] = None) -> None:
         self.data = data
         self.error = error
@@ -49,16 +86,33 @@ class DummyExecuteResponse:
 # =====================================================================
 
 
-class DummyExecutable(Executable):
+class DummyExecutable:  # implements Executable structurally
     """
     Represents the final `.execute()` call in the Supabase chain.
 
     DummyTableQuery.upsert() returns an instance of this class. When `.execute()`
     is called, it returns a SupabaseExecuteResponse containing the upserted record.
+
+    It conforms to pke.types.Executable structurally (checked by mypy) rather
+    than subclassing the Protocol, so construction stays a plain‑class __init__.
+
+    Each DummyTableQuery owns one instance and rebinds it per upsert. Each
+    bind builds a new response dict, so a response obtained earlier keeps
+    the record it was returned for.
     """
 
-    def __init__(self, record: Dict[str, Any]) -> None:
+    __slots__ = ("record", "_resp")
+
+    def __init__(self, record: Optional[Dict[str, Any]] = None) -> None:
+        self.record = record
+        # "data" is a 1‑tuple: tests only iterate/index it, never mutate it.
+        self._resp: SupabaseExecuteResponse = {"status": 200, "data": (record,)}
+
+    def bind(self, record: Dict[str, Any]) -> "DummyExecutable":
+        """Point this executable at `record`, with a fresh response for it."""
         self.record = record
+        self._resp = {"status": 200, "data": (record,)}
+        return self
 
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         """Required to satisfy the Executable Protocol."""
@@ -68,12 +122,10 @@ class DummyExecutable(Executable):
         """
         Execute the request and return a SupabaseExecuteResponse‑compatible object.
 
-        The record is returned inside a list to match the real Supabase client's
-        behavior for multi‑row upserts.
+        The record is returned inside a sequence (a tuple) to match the real
+        Supabase client's multi‑row shape. The response is prebuilt by bind().
         """
-        typed = cast(Dict[str, Any], self.record)
-        resp: SupabaseExecuteResponse = {"status": 200, "data": [typed]}
-        return resp
+        return self._resp
 
 
 # =====================================================================
@@ -88,23 +140,40 @@ class DummyTableQuery:
     Stores the last upserted record for inspection in tests.
     """
 
+    __slots__ = ("table_name", "last_upserted", "_exec")
+
     def __init__(self, table_name: str) -> None:
         self.table_name = table_name
         self.last_upserted: Optional[Dict[str, Any]] = None
+        # Reused by every upsert on this table instead of allocating anew.
+        self._exec = DummyExecutable()
+
+    def reset(self) -> None:
+        """Forget the last upserted record (used between tests)."""
+        self.last_upserted = None
+
+    def upsert_one(self, record: Dict[str, Any]) -> DummyExecutable:
+        """Upsert a single record."""
+        self.last_upserted = record
+        return self._exec.bind(record)
+
+    def upsert_many(self, records: List[Dict[str, Any]]) -> DummyExecutable:
+        """Upsert a batch of records; the first one is tracked as last_upserted."""
+        self.last_upserted = records[0]
+        return self._exec.bind(records[0])
 
     def upsert(self, record: Union[Dict[str, Any], List[Dict[str, Any]]]) -> DummyExecutable:
         """
         Accept either a single record or a list of records.
 
         The real Supabase client accepts both forms, so the dummy client mirrors
-        that behavior for test realism.
+        that behavior for test realism. Callers that know which form they have
+        can use upsert_one()/upsert_many() directly and skip the type check.
         """
+        # slow path: kept for chain‑style callers
         if isinstance(record, list):
-            self.last_upserted = record[0]
-            return DummyExecutable(record[0])
-        else:
-            self.last_upserted = record
-            return DummyExecutable(record)
+            return self.upsert_many(record)
+        return self.upsert_one(record)
 
 
 # =====================================================================
@@ -126,13 +195,39 @@ class DummyClient(SupabaseClientInterface):
     The last two are required by the Protocol but are no‑ops here.
     """
 
+    __slots__ = ("tables",)
+
     def __init__(self) -> None:
-        self.tables: Dict[str, DummyTableQuery] = {}
+        # A client only ever touches a handful of tables, so a flat list of
+        # (name, table) pairs scanned linearly beats hashing into a dict.
+        self.tables: List[Tuple[str, DummyTableQuery]] = []
 
     def table(self, name: str) -> DummyTableQuery:
-        if name not in self.tables:
-            self.tables[name] = DummyTableQuery(name)
-        return self.tables[name]
+        """
+        Return the table query object for `name`.
+
+        Each client owns its tables: a table is built the first time a
+        client asks for it and reused for that client only, so separate
+        DummyClient instances never see each other's last_upserted.
+        """
+        for known, table in self.tables:
+            # Table names are usually interned literals, so `is` hits first.
+            if known is name or known == name:
+                return table
+
+        table = DummyTableQuery(name)
+        self.tables.append((name, table))
+        return table
+
+    def reset(self) -> None:
+        """
+        Clear per‑test state while keeping the table objects.
+
+        Lets a single DummyClient be shared across a test session (see the
+        `dummy_client` fixture in conftest.py) instead of rebuilding it.
+        """
+        for _, table in self.tables:
+            table.reset()
 
     def upsert(
         self,
@@ -145,7 +240,7 @@ class DummyClient(SupabaseClientInterface):
         Mirrors the Protocol signature and supports both single‑record and
         multi‑record upserts.
         """
-        payload = record if isinstance(record, list) else [record]
+        payload = record if isinstance(record, list) else (record,)
         return {"status": 200, "data": payload}
 
     def list(self, query: TableQuery) -> List[NoteRecord]:
@@ -153,17 +248,10 @@ class DummyClient(SupabaseClientInterface):
         Return a deterministic NoteRecord.
 
         This ensures predictable behavior in tests without depending on the
-        real Supabase backend.
-        """
-        return [
-            {
-                "id": "dummy-id",
-                "title": "dummy title",
-                "body": "dummy body",
-                "metadata": {},
-                "embedding": [0.0] * 1536,
-            }
-        ]
+        real Supabase backend. The same shared, read‑only response is
+        returned on every call.
+        """
+        return _DUMMY_LIST_RESPONSE
 
     # ------------------------------------------------------------------
     # Required by SupabaseClientInterface but unused in DummyClient
@@ -184,7 +272,7 @@ class DummyClient(SupabaseClientInterface):
 
         Required by the Protocol. Returns an empty successful response.
         """
-        return {"status": 200, "data": []}
+        return {"status": 200, "data": ()}
 
 
 # =====================================================================
@@ -200,14 +288,14 @@ class FailingClient(SupabaseClientInterface):
     """
 
     def table(self, name: str) -> "FailingTable":
-        return FailingTable()
+        return _FAILING_TABLE
 
     def upsert(
         self,
         record: Union[Dict[str, Any], List[Dict[str, Any]]],
         on_conflict: Optional[str] = None,
     ) -> SupabaseExecuteResponse:
-        return {"status": 500, "data": None}
+        return _FAIL_RESP
 
     def list(self, query: TableQuery) -> List[NoteRecord]:
         raise RuntimeError("Simulated failure")
@@ -217,7 +305,7 @@ class FailingClient(SupabaseClientInterface):
         return self
 
     def execute(self) -> SupabaseExecuteResponse:
-        return {"status": 500, "data": None}
+        return _FAIL_RESP
 
 
 # =====================================================================
@@ -232,8 +320,10 @@ class FailingTable:
     Its `.upsert()` returns a FailingExecutable.
     """
 
+    __slots__ = ()
+
     def upsert(self, record: Dict[str, Any]) -> "FailingExecutable":
-        return FailingExecutable()
+        return _FAILING_EXECUTABLE
 
 
 # =====================================================================
@@ -248,8 +338,16 @@ class FailingExecutable:
     Its `.execute()` returns an error response.
     """
 
+    __slots__ = ()
+
     def execute(self) -> SupabaseExecuteResponse:
-        return {"status": 500, "data": None}
+        return _FAIL_RESP
 
     def __call__(self) -> Any:
         return self
+
+
+# Both failing doubles are stateless, so one instance of each is shared by
+# every FailingClient instead of allocating new ones per call.
+_FAILING_TABLE = FailingTable()
+_FAILING_EXECUTABLE = FailingExecutable()
@@ -1,15 +1,13 @@
-import json
-
 from pke.ingestion.orchestrator import ingest_notes
 
 
-def test_e2e_ingestion_dry_run(tmp_path):
+def test_e2e_ingestion_dry_run(parsed_notes_dry_run):
     """
     End‑to‑end ingestion test (dry‑run mode).
 
     This test validates the entire ingestion pipeline WITHOUT touching Supabase:
 
-        • Parsed notes are loaded (simulated Stage 1 output)
+        • Parsed notes are supplied (simulated Stage 1 output)
         • Orchestrator runs in dry‑run mode
         • Notebook resolution is exercised
         • Tag extraction is exercised
@@ -20,37 +18,10 @@ def test_e2e_ingestion_dry_run(tmp_path):
     """
 
     # ----------------------------------------------------------------------
-    # 1. Create a minimal parsed_notes.json fixture in a temp directory
+    # 1. Parsed notes come from the session-scoped conftest fixture
     # ----------------------------------------------------------------------
-    parsed_notes = [
-        {
-            "id": "note-1",
-            "title": "Test Note One",
-            "body": "This is a test note.",
-            "notebook": "Work",
-            "tags": ["project", "urgent"],
-            "metadata": {"created_time": "2024-01-01T12:00:00"},
-        },
-        {
-            "id": "note-2",
-            "title": "Test Note Two",
-            "body": "Another test note.",
-            "notebook": "Personal",
-            "tags": ["journal"],
-            "metadata": {"created_time": "2024-01-02T12:00:00"},
-        },
-        {
-            "id": "note-3",
-            "title": "Empty Body Note",
-            "body": "",
-            "notebook": "Work",
-            "tags": ["skipme"],
-            "metadata": {"created_time": "2024-01-03T12:00:00"},
-        },
-    ]
-
-    parsed_path = tmp_path / "parsed_notes.json"
-    parsed_path.write_text(json.dumps(parsed_notes), encoding="utf-8")
+    # The orchestrator takes the notes directly, so nothing is written to disk.
+    parsed_notes = parsed_notes_dry_run
 
     # ----------------------------------------------------------------------
     # 2. Run orchestrator in DRY‑RUN mode
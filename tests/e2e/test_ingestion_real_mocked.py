@@ -1,8 +1,23 @@
+from types import MappingProxyType
+
 from pke.ingestion.orchestrator import ingest_notes
 from tests.fixtures.mock_supabase import MockSupabaseClient
 
+# Expected call sequence: notebooks → tags → (note → relationships) per note.
+_EXPECTED_ORDER = (
+    "upsert_notebooks",
+    "upsert_tags",
+    "upsert_note_with_embedding",
+    "upsert_note_tag_relationships",
+    "upsert_note_with_embedding",
+    "upsert_note_tag_relationships",
+)
+
+# Payload MockSupabaseClient logs for upsert_notebooks (notebook → note IDs).
+_EXPECTED_NOTEBOOK_PAYLOAD = MappingProxyType({"Work": ["n1"], "Personal": ["n2"]})
 
-def test_ingestion_real_with_mocked_supabase():
+
+def test_ingestion_real_with_mocked_supabase(parsed_notes_mocked):
     """
     End‑to‑end test of the ingestion orchestrator using the MockSupabaseClient.
 
@@ -15,28 +30,9 @@ def test_ingestion_real_with_mocked_supabase():
     """
 
     # ----------------------------------------------------------------------
-    # Sample parsed notes
-    # ----------------------------------------------------------------------
-    # IMPORTANT:
-    # The orchestrator requires the field "body", not "content".
-    # Using "content" causes a KeyError('body'), which the orchestrator catches
-    # and records as a failure. That was the root cause of the previous failures.
-    parsed_notes = [
-        {
-            "id": "n1",
-            "title": "Note A",
-            "body": "Alpha content",  # FIXED: was "content"
-            "notebook": "Work",
-            "tags": ["t1", "t2"],
-        },
-        {
-            "id": "n2",
-            "title": "Note B",
-            "body": "Bravo content",  # FIXED: was "content"
-            "notebook": "Personal",
-            "tags": ["t2"],
-        },
-    ]
+    # Sample parsed notes (session-scoped fixture, see conftest.py)
+    # ----------------------------------------------------------------------
+    parsed_notes = parsed_notes_mocked
 
     client = MockSupabaseClient()
 
@@ -81,34 +77,27 @@ def test_ingestion_real_with_mocked_supabase():
     # ----------------------------------------------------------------------
     # Validate call order
     # ----------------------------------------------------------------------
-    expected_order = [
-        "upsert_notebooks",
-        "upsert_tags",
-        "upsert_note_with_embedding",
-        "upsert_note_tag_relationships",
-        "upsert_note_with_embedding",
-        "upsert_note_tag_relationships",
-    ]
-    assert [c[0] for c in client.calls] == expected_order
+    calls = list(client.calls)
+    assert tuple(c[0] for c in calls) == _EXPECTED_ORDER
 
     # ----------------------------------------------------------------------
     # Validate notebook upsert payload
     # ----------------------------------------------------------------------
-    first_call = client.calls[0]
+    first_call = calls[0]
     assert first_call[0] == "upsert_notebooks"
-    assert first_call[1] == {"Work": ["n1"], "Personal": ["n2"]}
+    assert first_call[1] == _EXPECTED_NOTEBOOK_PAYLOAD
 
     # ----------------------------------------------------------------------
     # Validate tag upsert payload
     # ----------------------------------------------------------------------
-    second_call = client.calls[1]
+    second_call = calls[1]
     assert second_call[0] == "upsert_tags"
     assert set(second_call[1]) == {"t1", "t2"}
 
     # ----------------------------------------------------------------------
     # Validate note upserts
     # ----------------------------------------------------------------------
-    note_calls = [c for c in client.calls if c[0] == "upsert_note_with_embedding"]
+    note_calls = client.calls_of("upsert_note_with_embedding")
     assert len(note_calls) == 2
 
     # First note
@@ -122,7 +111,7 @@ def test_ingestion_real_with_mocked_supabase():
     # ----------------------------------------------------------------------
     # Validate note‑tag relationships
     # ----------------------------------------------------------------------
-    rel_calls = [c for c in client.calls if c[0] == "upsert_note_tag_relationships"]
+    rel_calls = client.calls_of("upsert_note_tag_relationships")
     assert len(rel_calls) == 2
 
     # First note relationships
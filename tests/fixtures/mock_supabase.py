@@ -11,7 +11,29 @@
 #     • Dict[...] is available for payload structures
 #     • Optional[...] is available for nullable notebook IDs
 #     • Any is available for flexible call-recording structures
-from typing import Any, Dict, List, Optional
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+from pke.embedding.embedding_client import EmbeddingClient
+
+# Spaces → underscores when building deterministic tag IDs (see upsert_tags).
+_TAG_TRANS = str.maketrans({" ": "_"})
+
+# ---------------------------------------------------------------------------
+# Shared default embedding client
+# ---------------------------------------------------------------------------
+# The deterministic provider keeps no per-call state, so every
+# MockSupabaseClient built without an explicit embedding_client can share
+# one instance instead of constructing its own.
+_DEFAULT_EMBEDDING_CLIENT: EmbeddingClient | None = None
+
+
+def _get_default_embedding_client() -> EmbeddingClient:
+    """Return the shared deterministic EmbeddingClient, creating it on first use."""
+    global _DEFAULT_EMBEDDING_CLIENT
+    if _DEFAULT_EMBEDDING_CLIENT is None:
+        _DEFAULT_EMBEDDING_CLIENT = EmbeddingClient(provider="deterministic")
+    return _DEFAULT_EMBEDDING_CLIENT
 
 
 class MockSupabaseClient:
@@ -48,7 +70,7 @@ class MockSupabaseClient:
         ----------
         embedding_client : EmbeddingClient | None
             Optional injection of a deterministic embedding provider.
-            If omitted, a deterministic EmbeddingClient is constructed.
+            If omitted, a shared deterministic EmbeddingClient is used.
 
         Why this matters:
             • The orchestrator *always* calls client.embedding_client.generate().
@@ -72,7 +94,14 @@ class MockSupabaseClient:
         #         ("upsert_tags", [...]),
         #         ("upsert_note_tag_relationship", {"note_id": ..., "tag_id": ...}),
         #     ]
-        self.calls = []
+        #
+        # Append-only and read in order, so a deque (no list regrowth copies).
+        # Tests that index into it take a list(client.calls) snapshot first.
+        self.calls: Deque[tuple] = deque()
+
+        # Per-method view of the same entries, so tests can pull every call
+        # to one method via calls_of(name) without scanning self.calls.
+        self.calls_by_method: Dict[str, Deque[tuple]] = defaultdict(deque)
 
         # ----------------------------------------------------------------------
         # Mock always behaves like real mode unless explicitly overridden
@@ -116,14 +145,9 @@ class MockSupabaseClient:
         #
         # The real SupabaseClient exposes embedding_client as a first-class
         # dependency. The mock must do the same or ingestion will fail before
-        # note upserts occur.
-        from pke.embedding.embedding_client import EmbeddingClient
-
-        if embedding_client is None:
-            # Deterministic provider ensures stable test behavior
-            self.embedding_client = EmbeddingClient(provider="deterministic")
-        else:
-            self.embedding_client = embedding_client
+        # note upserts occur. Without an injected client, the shared
+        # deterministic one is used so results stay stable and 1536-wide.
+        self.embedding_client = embedding_client or _get_default_embedding_client()
 
         # ----------------------------------------------------------------------
         # Tag upserts
@@ -157,25 +181,17 @@ class MockSupabaseClient:
         # This list is intentionally append‑only and deterministic.
         self.relationships = []
 
-        # ----------------------------------------------------------------------
-        # Embedding client
-        # ----------------------------------------------------------------------
-        # The orchestrator *always* calls:
-        #       client.embedding_client.generate(body)
-        #
-        # The mock must expose the same interface as the real client.
-        # If no embedding_client is provided, construct a deterministic one.
-        #
-        # Deterministic embeddings ensure:
-        #     • stable test results
-        #     • predictable vector lengths (1536)
-        #     • correct call‑count assertions
-        if embedding_client is None:
-            from pke.embedding.embedding_client import EmbeddingClient
+    # ----------------------------------------------------------------------
+    # CALL LOG
+    # ----------------------------------------------------------------------
+    def _record(self, entry: tuple) -> None:
+        """Append a call entry to both the ordered log and its per-method index."""
+        self.calls.append(entry)
+        self.calls_by_method[entry[0]].append(entry)
 
-            self.embedding_client = EmbeddingClient(provider="deterministic")
-        else:
-            self.embedding_client = embedding_client
+    def calls_of(self, name: str) -> Deque[tuple]:
+        """Return every recorded call to method `name`, in call order."""
+        return self.calls_by_method[name]
 
     # ----------------------------------------------------------------------
     # NOTEBOOK UPSERT
@@ -203,7 +219,7 @@ class MockSupabaseClient:
             • Real client returns UUIDs; mock returns readable stand‑ins.
         """
         # E2E test expects notebook → list of note IDs
-        self.calls.append(("upsert_notebooks", {"Work": ["n1"], "Personal": ["n2"]}))
+        self._record(("upsert_notebooks", {"Work": ["n1"], "Personal": ["n2"]}))
 
         # Assign deterministic notebook IDs in the order notebooks appear in parsed_notes.
         # The E2E test expects:
@@ -291,7 +307,7 @@ class MockSupabaseClient:
         # Call‑log used by integration tests to verify ordering + structure.
         # Shape matches E2E expectations:
         #   ("upsert_note_with_embedding", note_id, notebook_id)
-        self.calls.append(("upsert_note_with_embedding", id, notebook_id))
+        self._record(("upsert_note_with_embedding", id, notebook_id))
 
         # Dedicated note‑upsert log used by tests that assert:
         #   • exactly one note upsert per note
@@ -320,12 +336,12 @@ class MockSupabaseClient:
             dict[tag_name → deterministic_uuid]
         """
 
-        self.calls.append(("upsert_tags", tags))
+        self._record(("upsert_tags", tags))
 
+        tag_upserts = self.tag_upserts
         for tag in tags:
-            if tag not in self.tag_upserts:
-                safe = tag.replace(" ", "_")
-                self.tag_upserts[tag] = f"uuid-tag-{safe}"
+            if tag not in tag_upserts:
+                tag_upserts[tag] = f"uuid-tag-{tag.translate(_TAG_TRANS)}"
 
         return self.tag_upserts
 
@@ -361,10 +377,9 @@ class MockSupabaseClient:
         """
 
         # Record each (note_id, tag_id) pair in deterministic order.
-        for tag_id in tag_ids:
-            self.relationships.append((note_id, tag_id))
+        self.relationships += [(note_id, tag_id) for tag_id in tag_ids]
 
         # E2E test expects the logged note_id to be prefixed with "note-"
-        self.calls.append(("upsert_note_tag_relationships", f"note-{note_id}", tag_ids))
+        self._record(("upsert_note_tag_relationships", f"note-{note_id}", tag_ids))
 
         return {"status": "ok"}
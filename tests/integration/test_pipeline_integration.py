@@ -259,3 +259,31 @@ def test_ingest_notes_idempotency(
     assert summary_1["notes_processed"] == summary_2["notes_processed"]
     assert summary_1["notes_inserted"] == summary_2["notes_inserted"]
     assert summary_1["notes_skipped"] == summary_2["notes_skipped"]
+
+
+# ======================================================================
+# Integration Test 3.4 — Duplicate Bodies Share One Embedding
+# ======================================================================
+def test_ingest_notes_embeds_duplicate_bodies_once(
+    mock_embedding_client,
+    mock_supabase_client,
+    load_json_fixture,
+):
+    """
+    Purpose:
+        Validate that notes with identical bodies in one batch trigger a
+        single embedding call, while every note is still upserted.
+
+    Expected Behavior:
+        • mock_embedding_client.calls == 1 for two identical bodies
+        • Both notes reach upsert_note_with_embedding
+    """
+
+    parsed_note = load_json_fixture("parsed_note_simple.json")
+    duplicate = dict(parsed_note, id="note-67890")
+
+    summary = ingest_notes([parsed_note, duplicate], mock_supabase_client)
+
+    assert mock_embedding_client.calls == 1
+    assert [p["id"] for p in mock_supabase_client.note_upserts] == ["note-12345", "note-67890"]
+    assert summary["notes_inserted"] == 2
@@ -0,0 +1,11 @@
+"""
+Filesystem locations shared by the test suite.
+
+Computed once at import so conftests and test modules don't each rebuild
+the same paths from __file__.
+"""
+
+from pathlib import Path
+
+# tests/fixtures/ — Markdown, JSON and mock-client fixtures
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
@@ -12,7 +12,11 @@ A lightweight FakeClient is used to simulate Supabase behavior.
 This keeps tests deterministic and avoids network calls.
 """
 
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping
+
+import pytest
+
 from pke.supabase_client import SupabaseClient
 
 # ---------------------------------------------------------------------------
@@ -30,7 +34,8 @@ class FakeTable:
         • .insert(payload)
         • .execute()
 
-    The FakeClient stores rows in-memory in a dict keyed by table name.
+    The FakeClient stores rows in-memory in a dict keyed by table name,
+    and keeps per-field indexes so `.eq()` filters are dict lookups.
 
     Type notes:
     - _select_fields: str | None
@@ -41,15 +46,25 @@ class FakeTable:
         Holds the payload passed to `.insert()`, or None if not inserting.
     """
 
-    def __init__(self, table_name: str, store: Dict[str, List[Dict[str, Any]]]):
+    __slots__ = ("table_name", "client", "_select_fields", "_filters", "_insert_payload")
+
+    def __init__(self, table_name: str, client: "FakeClient"):
         self.table_name = table_name
-        self.store = store
+        self.client = client
 
         # Explicit type annotations ensure mypy does not infer incorrect types.
         self._select_fields: str | None = None
         self._filters: Dict[str, Any] = {}
         self._insert_payload: Dict[str, Any] | None = None
 
+    def begin(self, table_name: str) -> "FakeTable":
+        """Clear any previous query state and retarget the builder at `table_name`."""
+        self.table_name = table_name
+        self._select_fields = None
+        self._filters.clear()
+        self._insert_payload = None
+        return self
+
     # --- Query builder methods ------------------------------------------------
 
     def select(self, fields: str) -> "FakeTable":
@@ -74,109 +89,265 @@ class FakeTable:
 
         This keeps behavior consistent with your existing DummyClient tests.
         """
-        table_rows = self.store.setdefault(self.table_name, [])
-
         # INSERT path
         if self._insert_payload is not None:
-            # Simulate UUID assignment
-            new_row = {"id": f"uuid-{len(table_rows) + 1}", **self._insert_payload}
-            table_rows.append(new_row)
-            return {"data": [new_row], "status": 200}
+            return {
+                "data": [self.client.insert(self.table_name, self._insert_payload)],
+                "status": 200,
+            }
 
         # SELECT path
-        results = table_rows
-        for field, value in self._filters.items():
-            results = [row for row in results if row.get(field) == value]
-
-        return {"data": results, "status": 200}
+        return {"data": self.client.find(self.table_name, **self._filters), "status": 200}
 
 
 class FakeClient:
     """
     Minimal Supabase-like client exposing `.table(name)`.
 
-    The internal store is a dict:
+    Rows live in a dict keyed by table name:
         { "notebooks": [ {id, title}, ... ] }
+
+    exposed read-only as `store`; they are written only through seed() and
+    insert(). Alongside them, `indexes` maps table → field → value → rows.
+    A field is indexed the first time find() filters on it, and insert()
+    keeps every built index current. Unhashable values (dict/list columns
+    such as metadata) are left out of the indexes and matched by a scan.
+    Rows must not be edited in place; find() re-checks its candidates so
+    such an edit can never return a row that no longer matches.
     """
 
-    def __init__(self) -> None:
-        self.store: Dict[str, List[Dict[str, Any]]] = {}
+    def __init__(self, seed: Dict[str, List[Dict[str, Any]]] | None = None) -> None:
+        self._rows: Dict[str, List[Dict[str, Any]]] = {}
+        self.indexes: Dict[str, Dict[str, Dict[Any, List[Dict[str, Any]]]]] = {}
+        # One builder reused by every table() call. Each query chain is
+        # executed before the next table() call, which holds for the
+        # single-threaded resolver under test.
+        self._builder = FakeTable("", self)
+
+        for table_name, rows in (seed or {}).items():
+            self.seed(table_name, rows)
+
+    @property
+    def store(self) -> Mapping[str, List[Dict[str, Any]]]:
+        """Read-only view of every table's rows."""
+        return MappingProxyType(self._rows)
+
+    def seed(self, table_name: str, rows: List[Dict[str, Any]]) -> None:
+        """Replace `table_name`'s rows; its indexes are rebuilt on next use."""
+        self._rows[table_name] = list(rows)
+        self.indexes.pop(table_name, None)
 
     def table(self, name: str) -> FakeTable:
-        return FakeTable(name, self.store)
+        return self._builder.begin(name)
+
+    def reset(self) -> None:
+        """Drop all rows and indexes so the client can be reused by another test."""
+        self._rows.clear()
+        self.indexes.clear()
+
+    def index(self, table_name: str, field: str) -> Dict[Any, List[Dict[str, Any]]]:
+        """Return the value → rows index for `field`, building it on first use."""
+        by_field = self.indexes.setdefault(table_name, {})
+        try:
+            return by_field[field]
+        except KeyError:
+            pass
+
+        by_value: Dict[Any, List[Dict[str, Any]]] = {}
+        for row in self._rows.get(table_name, ()):
+            _index_row(by_value, field, row)
+        by_field[field] = by_value
+        return by_value
+
+    # --- Fused fast paths (also back FakeTable.execute) ---------------------
+
+    def find(self, table_name: str, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Rows of `table_name` matching every `field=value` filter.
+
+        Equivalent to table(name).select(...).eq(...)...execute()["data"].
+        The first filter is an index lookup; the candidates are then checked
+        against every filter in one pass.
+        """
+        if not filters:
+            return list(self._rows.get(table_name, ()))
+
+        field, value = next(iter(filters.items()))
+        try:
+            candidates = self.index(table_name, field).get(value, ())
+        except TypeError:
+            # Unhashable filter value: not indexable, so scan the table.
+            candidates = self._rows.get(table_name, ())
+        return [row for row in candidates if all(row.get(f) == v for f, v in filters.items())]
+
+    def insert(self, table_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert `payload` with a simulated UUID and return the new row."""
+        rows = self._rows.setdefault(table_name, [])
+        new_row = {"id": f"uuid-{len(rows) + 1}", **payload}
+        rows.append(new_row)
+        self.add_to_indexes(table_name, new_row)
+        return new_row
+
+    def add_to_indexes(self, table_name: str, row: Dict[str, Any]) -> None:
+        """Add a freshly inserted row to every index already built for the table."""
+        for field, by_value in self.indexes.get(table_name, {}).items():
+            _index_row(by_value, field, row)
+
+
+def _index_row(by_value: Dict[Any, List[Dict[str, Any]]], field: str, row: Dict[str, Any]) -> None:
+    """Add `row` under its `field` value, skipping unhashable values (found by scan)."""
+    try:
+        by_value.setdefault(row.get(field), []).append(row)
+    except TypeError:
+        pass
 
 
 # ---------------------------------------------------------------------------
-# Tests
+# Fixtures
 # ---------------------------------------------------------------------------
+# One SupabaseClient(FakeClient()) per module; the FakeClient is reset after
+# every test so each test still starts from an empty store.
 
 
-def test_resolve_notebook_id_returns_none_for_missing_title() -> None:
-    """
-    If a note has no notebook title, resolution should return None.
-    """
-    client = SupabaseClient(FakeClient())
-    assert client.resolve_notebook_id(None) is None
-    assert client.resolve_notebook_id("") is None
+@pytest.fixture(scope="module")
+def _shared_fake_supabase() -> SupabaseClient:
+    return SupabaseClient(FakeClient())
+
 
+@pytest.fixture
+def fake_supabase(_shared_fake_supabase: SupabaseClient) -> Iterator[SupabaseClient]:
+    """SupabaseClient wrapping an empty FakeClient."""
+    yield _shared_fake_supabase
+    _shared_fake_supabase.client.reset()
 
-def test_resolve_notebook_id_inserts_new_notebook() -> None:
+
+@pytest.fixture
+def seeded_fake_supabase(
+    fake_supabase: SupabaseClient,
+) -> Callable[[str, List[Dict[str, Any]]], SupabaseClient]:
+    """Factory: seed `table` with `rows`, then return the shared client."""
+
+    def _seed(table: str, rows: List[Dict[str, Any]]) -> SupabaseClient:
+        fake_supabase.client.seed(table, rows)
+        return fake_supabase
+
+    return _seed
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "seed, title, expected_id, expected_count",
+    [
+        # Missing title → None, nothing inserted
+        pytest.param([], None, None, 0, id="none-title"),
+        pytest.param([], "", None, 0, id="empty-title"),
+        # Unknown notebook → inserted, new UUID returned
+        pytest.param([], "Work Notes", "uuid-1", 1, id="inserts-new"),
+        # Existing notebook → its UUID, no duplicate inserted
+        pytest.param(
+            [{"id": "uuid-1", "title": "Personal"}], "Personal", "uuid-1", 1, id="existing"
+        ),
+        # Several rows with one title → first match wins (as in Supabase)
+        pytest.param(
+            [{"id": "uuid-1", "title": "Archive"}, {"id": "uuid-2", "title": "Archive"}],
+            "Archive",
+            "uuid-1",
+            2,
+            id="first-of-duplicates",
+        ),
+    ],
+)
+def test_resolve_notebook_id(
+    seeded_fake_supabase,
+    seed: List[Dict[str, Any]],
+    title: str | None,
+    expected_id: str | None,
+    expected_count: int,
+) -> None:
     """
-    When a notebook does not exist, the client should insert it and return its UUID.
+    resolve_notebook_id() looks a notebook up by title, inserting it when
+    absent, and returns None for a missing title.
     """
-    client = SupabaseClient(FakeClient())
+    client = seeded_fake_supabase("notebooks", list(seed))
 
-    notebook_id = client.resolve_notebook_id("Work Notes")
+    resolved = client.resolve_notebook_id(title)
 
-    assert notebook_id is not None
-    assert notebook_id.startswith("uuid-")
+    assert resolved == expected_id
 
-    # Ensure it was actually inserted
     stored = client.client.store["notebooks"]
-    assert stored[0]["title"] == "Work Notes"
-    assert stored[0]["id"] == notebook_id
+    assert len(stored) == expected_count
+    if expected_id is not None:
+        # The returned id belongs to a stored row with the requested title.
+        assert {"id": expected_id, "title": title} in stored
 
 
-def test_resolve_notebook_id_returns_existing_notebook() -> None:
+def test_fake_client_index_tracks_seeded_and_inserted_rows() -> None:
     """
-    If a notebook already exists, resolution should return the existing UUID
-    and should NOT insert a duplicate.
+    The FakeClient's field indexes must see rows passed via `seed` and rows
+    added through `.insert()`, including on fields first queried later.
     """
-    fake = FakeClient()
-    fake.store["notebooks"] = [{"id": "uuid-1", "title": "Personal"}]
+    fake = FakeClient(seed={"notebooks": [{"id": "uuid-1", "title": "Personal"}]})
+
+    def find(title: str) -> List[Dict[str, Any]]:
+        return fake.table("notebooks").select("id").eq("title", title).execute()["data"]
+
+    assert [row["id"] for row in find("Personal")] == ["uuid-1"]
 
-    client = SupabaseClient(fake)
+    fake.table("notebooks").insert({"title": "Work", "color": "blue"}).execute()
+    assert [row["id"] for row in find("Work")] == ["uuid-2"]
+    assert [row["id"] for row in fake.find("notebooks", color="blue")] == ["uuid-2"]
 
-    resolved = client.resolve_notebook_id("Personal")
+    filtered = fake.table("notebooks").eq("title", "Work").eq("id", "uuid-1").execute()
+    assert filtered["data"] == []
 
-    assert resolved == "uuid-1"
-    assert len(fake.store["notebooks"]) == 1  # No duplicates inserted
+    fake.seed("notebooks", [{"id": "uuid-9", "title": "Archive"}])
+    assert [row["id"] for row in find("Archive")] == ["uuid-9"]
+    assert find("Personal") == []
 
 
-def test_resolve_notebook_id_handles_multiple_rows() -> None:
+def test_fake_client_store_is_read_only_and_find_rechecks_rows() -> None:
     """
-    If multiple notebooks somehow exist with the same title,
-    the resolver should return the first match (consistent with Supabase behavior).
+    `store` cannot be reassigned, and a row edited in place is never
+    returned for a value it no longer has.
     """
-    fake = FakeClient()
-    fake.store["notebooks"] = [
-        {"id": "uuid-1", "title": "Archive"},
-        {"id": "uuid-2", "title": "Archive"},
-    ]
+    fake = FakeClient(seed={"notebooks": [{"id": "uuid-1", "title": "Personal"}]})
 
-    client = SupabaseClient(fake)
+    with pytest.raises(TypeError):
+        fake.store["notebooks"] = []  # type: ignore[index]
 
-    resolved = client.resolve_notebook_id("Archive")
+    fake.store["notebooks"][0]["title"] = "Work"
+    assert fake.find("notebooks", title="Personal") == []
 
-    assert resolved == "uuid-1"  # First match wins
 
+def test_fake_client_accepts_rows_with_unhashable_values() -> None:
+    """
+    Rows holding dicts or lists can be seeded, inserted and filtered on;
+    unhashable values are matched by a scan instead of an index lookup.
+    """
+    fake = FakeClient(seed={"notes": [{"id": "1", "metadata": {}, "tags": ["a"]}]})
 
-def test_resolve_notebook_id_insert_returns_row() -> None:
+    assert [row["id"] for row in fake.find("notes", metadata={})] == ["1"]
+
+    row = fake.insert("notes", {"metadata": {"k": "v"}, "tags": []})
+    assert fake.find("notes", metadata={"k": "v"}) == [row]
+    assert fake.find("notes", tags=["a"], id="1")[0]["id"] == "1"
+    assert [r["id"] for r in fake.find("notes", id="uuid-2")] == ["uuid-2"]
+
+
+def test_fake_client_fused_paths_match_builder_chain() -> None:
     """
-    Ensures that insert returns a row with an id field.
+    FakeClient.find()/insert() must return what the equivalent builder
+    chains return.
     """
-    client = SupabaseClient(FakeClient())
-    notebook_id = client.resolve_notebook_id("Research")
+    fake = FakeClient(seed={"notebooks": [{"id": "uuid-1", "title": "Personal"}]})
+
+    chained = fake.table("notebooks").select("id").eq("title", "Personal").execute()
+    assert fake.find("notebooks", title="Personal") == chained["data"]
 
-    assert isinstance(notebook_id, str)
-    assert notebook_id.startswith("uuid-")
+    row = fake.insert("notebooks", {"title": "Work"})
+    assert row == {"id": "uuid-2", "title": "Work"}
+    assert fake.table("notebooks").eq("title", "Work").execute()["data"] == [row]
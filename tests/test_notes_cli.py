@@ -1,13 +1,14 @@
 # tests/test_notes_cli.py
 
+import pytest
 
+
+@pytest.mark.skip(reason="Scaffold — replace when CLI commands land")
 def test_notes_cli_scaffold_runs() -> None:
     """
-    Smoke test for the CLI scaffold.
+    Placeholder for CLI scaffold coverage.
 
-    This test intentionally does very little: it simply ensures that the
-    CLI module imports and the placeholder entrypoint executes without
-    raising errors. As real commands are added, this test will be replaced
-    with functional coverage.
+    Reported as skipped rather than run, since it has no assertions yet.
+    As real commands are added, this test will be replaced with functional
+    coverage.
     """
-    assert True
@@ -1,13 +1,19 @@
 import os
 
 from pke.parsers.joplin_markdown import parse_note
+from tests.paths import FIXTURES_DIR
 
 
 def test_basic() -> None:
-    filepath = os.path.join(os.path.dirname(__file__), "fixtures", "real_note_1.md")
-    result = parse_note(filepath)
-    print("✅ Parsed real Joplin note")
-    print(result)
+    result = parse_note(FIXTURES_DIR / "real_note_1.md")
+
+    assert result is not None
+    assert result["id"] == "real_note_1"
+    assert "body" in result
+
+    if os.environ.get("PKE_DEBUG"):
+        print("✅ Parsed real Joplin note")
+        print(result)
 
 
 if __name__ == "__main__":
@@ -17,19 +17,27 @@ Run from project root:
     pytest -q
 """
 
-from typing import List
+from typing import Any, List
+
+import httpx
 import pytest
+from postgrest.exceptions import APIError
 
 from pke.supabase_client import SupabaseClient
 from pke.types import NoteRecord
-from tests.dummy_supabase import DummyClient  # Fully typed, reusable test double
+from tests.dummy_supabase import DummyClient  # Fully typed test doubles
+
+# Width of every embedding produced by the deterministic EmbeddingClient.
+_EMBEDDING_DIM = 1536
 
 # =====================================================================
 # Test: Successful upsert with embedding generation
 # =====================================================================
 
 
-def test_upsert_note_with_embedding_returns_record_and_embedding_length() -> None:
+def test_upsert_note_with_embedding_returns_record_and_embedding_length(
+    dummy_client: DummyClient,
+) -> None:
     """
     Validates that SupabaseClient.upsert_note_with_embedding:
 
@@ -38,10 +46,10 @@ def test_upsert_note_with_embedding_returns_record_and_embedding_length() -> Non
         • attaches a 1536‑dimensional embedding vector generated by
           the client's embedding_client
 
-    This test uses DummyClient to avoid real Supabase calls.
+    This test uses the shared DummyClient fixture to avoid real Supabase calls.
     """
 
-    client = SupabaseClient(client=DummyClient())
+    client = SupabaseClient(client=dummy_client)
 
     title = "Unit Test"
     body = "unit test body"
@@ -75,7 +83,7 @@ def test_upsert_note_with_embedding_returns_record_and_embedding_length() -> Non
     emb = rec.get("embedding")
     assert emb is not None
     assert isinstance(emb, list)
-    assert len(emb) == 1536
+    assert len(emb) == _EMBEDDING_DIM
 
 
 # =====================================================================
@@ -83,7 +91,7 @@ def test_upsert_note_with_embedding_returns_record_and_embedding_length() -> Non
 # =====================================================================
 
 
-def test_embedding_generation_is_deterministic() -> None:
+def test_embedding_generation_is_deterministic(dummy_client: DummyClient) -> None:
     """
     Ensures the deterministic embedding provider behaves as expected:
 
@@ -94,28 +102,99 @@ def test_embedding_generation_is_deterministic() -> None:
     used in tests and dry‑run mode.
     """
 
-    client = SupabaseClient(client=DummyClient())
+    client = SupabaseClient(client=dummy_client)
 
     a = client.embedding_client.generate("same text")
     b = client.embedding_client.generate("same text")
     c = client.embedding_client.generate("different text")
 
+    # list == list already compares element-wise in C (and stops at the
+    # first mismatch), so no array conversion is needed here.
+    assert len(a) == _EMBEDDING_DIM
     assert a == b, "Embedding generation must be deterministic for identical input"
     assert a != c, "Different inputs must produce different embeddings"
 
 
+# =====================================================================
+# Test: DummyClient tables
+# =====================================================================
+
+
+def test_dummy_clients_do_not_share_table_state() -> None:
+    """
+    Two DummyClient instances keep independent tables: upserts and
+    reset() on one never show up on the other.
+    """
+
+    a = DummyClient()
+    b = DummyClient()
+
+    a.table("notes").upsert({"id": "a"})
+    b.table("notes").upsert({"id": "b"})
+
+    assert a.table("notes") is not b.table("notes")
+    assert a.table("notes").last_upserted == {"id": "a"}
+    assert b.table("notes").last_upserted == {"id": "b"}
+
+    b.reset()
+    assert b.table("notes").last_upserted is None
+    assert a.table("notes").last_upserted == {"id": "a"}
+
+
+def test_dummy_table_upsert_dispatches_single_and_batch(dummy_client: DummyClient) -> None:
+    """
+    DummyTableQuery.upsert() must route dicts to upsert_one() and lists to
+    upsert_many(), with identical results to calling them directly.
+    """
+
+    table = dummy_client.table("notes")
+    first = {"id": "n1"}
+    second = {"id": "n2"}
+
+    single = table.upsert(first).execute()
+    assert table.last_upserted is first
+    assert table.upsert_one(first).execute() == single == {"status": 200, "data": (first,)}
+
+    batch = table.upsert([second, first]).execute()
+    assert table.last_upserted is second
+    assert (
+        table.upsert_many([second, first]).execute() == batch == {"status": 200, "data": (second,)}
+    )
+
+    # Earlier responses are not rewritten by later upserts.
+    assert single["data"] == (first,)
+
+
+def test_dummy_table_reuses_executable_across_upserts(dummy_client: DummyClient) -> None:
+    """
+    Each table reuses one DummyExecutable, rebound to the latest record.
+    """
+
+    table = dummy_client.table("notes")
+    first = {"id": "n1"}
+    second = {"id": "n2"}
+
+    exe = table.upsert_one(first)
+    first_resp = exe.execute()
+    assert first_resp["data"] == (first,)
+
+    assert table.upsert_one(second) is exe
+    assert exe.execute()["data"] == (second,)
+    assert first_resp["data"] == (first,)
+
+
 # =====================================================================
 # Test: Error handling
 # =====================================================================
 
 
-def test_upsert_note_with_embedding_raises_on_empty_body() -> None:
+def test_upsert_note_with_embedding_raises_on_empty_body(dummy_client: DummyClient) -> None:
     """
     Ensures that calling upsert_note_with_embedding with an empty body
     raises ValueError.
     """
 
-    client = SupabaseClient(client=DummyClient())
+    client = SupabaseClient(client=dummy_client)
 
     with pytest.raises(ValueError, match="body must be provided"):
         client.upsert_note_with_embedding(
@@ -124,7 +203,7 @@ def test_upsert_note_with_embedding_raises_on_empty_body() -> None:
             body="",
             metadata={},
             notebook_id=None,
-            embedding=[0.0] * 1536,
+            embedding=[0.0] * _EMBEDDING_DIM,
         )
 
 
@@ -143,5 +222,142 @@ def test_upsert_note_with_embedding_raises_if_client_is_none() -> None:
             body="test body",
             metadata={},
             notebook_id=None,
-            embedding=[0.0] * 1536,
+            embedding=[0.0] * _EMBEDDING_DIM,
+        )
+
+
+# =====================================================================
+# Test: Transient upsert failures are retried
+# =====================================================================
+
+
+class _FlakyClient:
+    """
+    Minimal client whose `.upsert().execute()` returns the queued
+    responses in order, raising any queued exception instead of returning
+    it. `.select().eq().execute()` always finds nothing.
+    """
+
+    def __init__(self, responses: List[Any]) -> None:
+        self.responses = responses
+        self.upserts = 0
+
+    def table(self, name: str) -> "_FlakyClient":
+        return self
+
+    def select(self, *columns: str) -> "_FlakyClient":
+        self._selecting = True
+        return self
+
+    def eq(self, field: str, value: str) -> "_FlakyClient":
+        return self
+
+    def upsert(self, payload: dict) -> "_FlakyClient":
+        self._selecting = False
+        return self
+
+    def execute(self) -> dict:
+        if self._selecting:
+            return {"status": 200, "data": []}
+        self.upserts += 1
+        resp = self.responses.pop(0)
+        if isinstance(resp, Exception):
+            raise resp
+        return resp
+
+
+def test_upsert_note_with_embedding_retries_transient_errors(monkeypatch) -> None:
+    """
+    A 429/5xx response is retried; the embedding passed in is reused as-is.
+    """
+    monkeypatch.setattr("pke.supabase_client.time.sleep", lambda _s: None)
+
+    fake = _FlakyClient([{"status": 429}, {"status": 503}, {"status": 200, "data": [{}]}])
+    client = SupabaseClient(client=fake)
+
+    result = client.upsert_note_with_embedding(
+        id="x",
+        title="Flaky",
+        body="test body",
+        metadata={},
+        notebook_id=None,
+        embedding=[0.0] * _EMBEDDING_DIM,
+    )
+
+    assert result == "inserted"
+    assert fake.upserts == 3
+
+
+def test_upsert_note_with_embedding_does_not_retry_client_errors(monkeypatch) -> None:
+    """
+    Non-transient errors (e.g. 400) surface immediately without retrying.
+    """
+    monkeypatch.setattr("pke.supabase_client.time.sleep", lambda _s: None)
+
+    fake = _FlakyClient([{"status": 400}])
+    client = SupabaseClient(client=fake)
+
+    with pytest.raises(RuntimeError, match="Supabase error"):
+        client.upsert_note_with_embedding(
+            id="x",
+            title="Bad Request",
+            body="test body",
+            metadata={},
+            notebook_id=None,
+            embedding=[0.0] * _EMBEDDING_DIM,
+        )
+
+    assert fake.upserts == 1
+
+
+def test_upsert_note_with_embedding_retries_httpx_transport_errors(monkeypatch) -> None:
+    """
+    httpx connect/read failures raised by the supabase-py client are
+    retried, even though they are not builtin ConnectionError/TimeoutError.
+    """
+    monkeypatch.setattr("pke.supabase_client.time.sleep", lambda _s: None)
+
+    fake = _FlakyClient(
+        [
+            httpx.ConnectError("connection refused"),
+            httpx.ReadTimeout("timed out"),
+            APIError({"message": "bad gateway", "code": 502}),
+            {"status": 200, "data": [{}]},
+        ]
+    )
+    client = SupabaseClient(client=fake)
+
+    result = client.upsert_note_with_embedding(
+        id="x",
+        title="Flaky",
+        body="test body",
+        metadata={},
+        notebook_id=None,
+        embedding=[0.0] * _EMBEDDING_DIM,
+    )
+
+    assert result == "inserted"
+    assert fake.upserts == 4
+
+
+def test_upsert_note_with_embedding_does_not_retry_postgrest_error_codes(monkeypatch) -> None:
+    """
+    A JSON APIError's .code is a PGRST/SQLSTATE string, not an HTTP status,
+    so it is not mistaken for a transient failure.
+    """
+    monkeypatch.setattr("pke.supabase_client.time.sleep", lambda _s: None)
+
+    fake = _FlakyClient([APIError({"message": "duplicate key", "code": "23505"})])
+    client = SupabaseClient(client=fake)
+
+    with pytest.raises(APIError):
+        client.upsert_note_with_embedding(
+            id="x",
+            title="Conflict",
+            body="test body",
+            metadata={},
+            notebook_id=None,
+            embedding=[0.0] * _EMBEDDING_DIM,
         )
+
+    assert fake.upserts == 1
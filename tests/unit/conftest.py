@@ -0,0 +1,109 @@
+"""
+Shared fixtures for the unit test suite.
+
+Parsed Markdown fixtures are produced once per session here, so tests that
+inspect parser output don't each re-read and re-parse the same files. The
+parsed results are also pickled into pytest's cache directory, so later
+runs skip frontmatter/YAML parsing until a fixture, the parser, its
+parsing libraries or the interpreter change.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+import pke.parsers.joplin_markdown as joplin_markdown
+from pke.parsers.joplin_markdown import parse_note
+from tests.paths import FIXTURES_DIR
+
+
+# ---------------------------------------------------------------------------
+# Helper: _parser_fingerprint
+# ---------------------------------------------------------------------------
+def _dist_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "missing"
+
+
+def _parser_fingerprint() -> bytes:
+    """
+    Everything besides the fixture itself that can change parse_note()'s
+    output: the parser source, the frontmatter/YAML libraries it relies on,
+    and the interpreter.
+    """
+    parts = (
+        Path(joplin_markdown.__file__).read_bytes(),
+        _dist_version("python-frontmatter").encode(),
+        _dist_version("PyYAML").encode(),
+        sys.version.encode(),
+    )
+    return b"\0".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Helper: _cached_parse
+# ---------------------------------------------------------------------------
+def _cached_parse(path: Path, cache_dir: Optional[Path], fingerprint: bytes) -> Dict[str, Any]:
+    """
+    parse_note(path), reusing a pickled result from an earlier run whose
+    fixture bytes and parser fingerprint hash to the same key.
+
+    Cache files are written to a temp file and os.replace()d into place,
+    so a concurrent reader (e.g. another xdist worker) never sees a partial
+    pickle; an unreadable entry is treated as a miss and rewritten.
+    """
+    if cache_dir is None:
+        return parse_note(path)
+
+    key = hashlib.sha256(fingerprint + b"\0" + path.read_bytes()).hexdigest()
+    cache = cache_dir / f"{path.name}.{key}.pkl"
+
+    try:
+        return pickle.loads(cache.read_bytes())
+    except Exception:
+        # Missing, truncated or otherwise unpicklable: treat as a miss.
+        pass
+
+    parsed = parse_note(path)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(parsed, f)
+        os.replace(tmp, cache)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return parsed
+
+
+# ---------------------------------------------------------------------------
+# Fixture: parsed_fixtures
+# ---------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def parsed_fixtures(pytestconfig):
+    """
+    Every tests/fixtures/*.md note parsed with parse_note(), keyed by file
+    name (e.g. "note_basic.md").
+
+    Shared by the whole session — treat the parsed dicts as read-only.
+    The on-disk cache lives under .pytest_cache and is skipped when the
+    cache provider is disabled (-p no:cacheprovider).
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    cache_dir = cache.mkdir("parsed_fixtures") if cache is not None else None
+
+    fingerprint = _parser_fingerprint()
+
+    return {
+        path.name: _cached_parse(path, cache_dir, fingerprint)
+        for path in sorted(FIXTURES_DIR.glob("*.md"))
+    }
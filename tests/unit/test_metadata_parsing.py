@@ -1,29 +1,18 @@
 import pytest  # noqa: F401
-from pathlib import Path
-from pke.parsers.joplin_markdown import parse_note
 
-
-# ---------------------------------------------------------------------------
-# Helper: load fixture files from tests/fixtures/
-# ---------------------------------------------------------------------------
-def load_fixture(name: str) -> Path:
-    """
-    Returns the full path to a fixture Markdown file.
-    """
-    base = Path(__file__).parent.parent / "fixtures"
-    return base / name
+# Parsed notes come from the session-scoped `parsed_fixtures` fixture in
+# tests/unit/conftest.py, keyed by fixture file name.
 
 
 # ---------------------------------------------------------------------------
 # 1. Basic metadata parsing
 # ---------------------------------------------------------------------------
-def test_parse_basic_note():
+def test_parse_basic_note(parsed_fixtures):
     """
     Validates that a simple Markdown note with minimal metadata is parsed
     correctly. Ensures that YAML frontmatter and body extraction work.
     """
-    path = load_fixture("note_basic.md")
-    parsed = parse_note(path)
+    parsed = parsed_fixtures["note_basic.md"]
 
     assert parsed["id"] == "note-basic-1234"
     assert parsed["title"] == "Basic Test Note"
@@ -39,12 +28,11 @@ def test_parse_basic_note():
 # ---------------------------------------------------------------------------
 # 2. Tag extraction
 # ---------------------------------------------------------------------------
-def test_parse_note_with_tags():
+def test_parse_note_with_tags(parsed_fixtures):
     """
     Ensures that tag lists are parsed correctly from YAML frontmatter.
     """
-    path = load_fixture("note_with_tags.md")
-    parsed = parse_note(path)
+    parsed = parsed_fixtures["note_with_tags.md"]
 
     assert parsed["id"] == "note-tags-5678"
     assert parsed["title"] == "Note With Tags"
@@ -57,12 +45,11 @@ def test_parse_note_with_tags():
 # ---------------------------------------------------------------------------
 # 3. Resource reference extraction
 # ---------------------------------------------------------------------------
-def test_parse_note_with_resources():
+def test_parse_note_with_resources(parsed_fixtures):
     """
     Ensures that resource IDs (:/abcdef...) are extracted from the body.
     """
-    path = load_fixture("note_with_resources.md")
-    parsed = parse_note(path)
+    parsed = parsed_fixtures["note_with_resources.md"]
 
     assert parsed["id"] == "note-resources-9999"
     assert parsed["title"] == "Note With Resources"
@@ -78,13 +65,12 @@ def test_parse_note_with_resources():
 # ---------------------------------------------------------------------------
 # 4. Missing metadata fields
 # ---------------------------------------------------------------------------
-def test_parse_note_missing_fields():
+def test_parse_note_missing_fields(parsed_fixtures):
     """
     Ensures that missing YAML fields do not break parsing and that the parser
     applies correct defaults (e.g., None or empty lists).
     """
-    path = load_fixture("note_missing_fields.md")
-    parsed = parse_note(path)
+    parsed = parsed_fixtures["note_missing_fields.md"]
 
     assert parsed["id"] == "note-missing-0001"
 
@@ -96,3 +82,19 @@ def test_parse_note_missing_fields():
 
     # Body should still be extracted
     assert "missing several metadata fields" in parsed["body"]
+
+
+# ---------------------------------------------------------------------------
+# 5. Cached results match a live parse
+# ---------------------------------------------------------------------------
+def test_parsed_fixtures_match_live_parse(parsed_fixtures):
+    """
+    Runs parse_note() on every fixture in this session and compares it
+    with the (possibly cached) parsed_fixtures, so the parser is always
+    exercised and a stale cache entry cannot go unnoticed.
+    """
+    from pke.parsers.joplin_markdown import parse_note
+    from tests.paths import FIXTURES_DIR
+
+    for name, cached in parsed_fixtures.items():
+        assert parse_note(FIXTURES_DIR / name) == cached, name
@@ -0,0 +1,54 @@
+"""
+tests/unit/test_orchestrator_embeddings.py
+
+Unit tests for the per-run embedding cache in pke/ingestion/orchestrator.py
+(_count_bodies / _generate_embedding), and for how ingest_notes() treats
+notes whose body cannot be counted or embedded.
+"""
+
+from pke.ingestion.orchestrator import _count_bodies, _generate_embedding, ingest_notes
+from tests.fixtures.mock_supabase import MockSupabaseClient
+
+
+def test_embedding_cache_keeps_only_bodies_with_pending_duplicates(mock_embedding_client):
+    """
+    The cache never holds a vector for a unique body, and drops a
+    duplicated body after its last use.
+    """
+    notes = [{"body": "dup"}, {"body": "unique"}, {"body": "dup"}]
+    remaining = _count_bodies(notes)
+    cache: dict = {}
+
+    first = _generate_embedding(mock_embedding_client, "dup", cache, remaining)
+    assert list(cache) == ["dup"]
+
+    _generate_embedding(mock_embedding_client, "unique", cache, remaining)
+    assert list(cache) == ["dup"]
+
+    assert _generate_embedding(mock_embedding_client, "dup", cache, remaining) is first
+    assert cache == {}
+    assert not remaining
+    assert mock_embedding_client.calls == 2
+
+
+def test_count_bodies_skips_non_string_bodies():
+    """Unhashable or non-string bodies are left out of the count."""
+    notes = [{"body": ["not", "text"]}, {"body": {"k": "v"}}, {"body": ""}, {"body": "ok"}]
+
+    assert _count_bodies(notes) == {"ok": 1}
+
+
+def test_malformed_body_is_recorded_as_a_failure_not_fatal():
+    """
+    A note whose body is not a string fails on its own and lands in the
+    report's failures; the remaining notes are still ingested.
+    """
+    notes = [
+        {"id": "bad", "title": "Bad", "body": ["not", "text"]},
+        {"id": "good", "title": "Good", "body": "valid body"},
+    ]
+
+    summary = ingest_notes(notes, MockSupabaseClient())
+
+    assert summary["notes_inserted"] == 1
+    assert [failure["id"] for failure in summary["failures"]] == ["bad"]